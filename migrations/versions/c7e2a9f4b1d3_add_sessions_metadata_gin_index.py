@@ -0,0 +1,55 @@
+"""add GIN index on sessions metadata
+
+Session list filters on metadata compile to JSONB containment (@>), which
+without an index falls back to a sequential scan over the workspace's
+sessions. A jsonb_path_ops GIN index serves those predicates directly.
+
+Revision ID: c7e2a9f4b1d3
+Revises: e4eba9cfaa6f
+Create Date: 2026-10-14
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from migrations.utils import get_schema, index_exists
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2a9f4b1d3"
+down_revision: str | None = "e4eba9cfaa6f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+schema = get_schema()
+
+
+def upgrade() -> None:
+    """Add GIN index on sessions.metadata for containment filters."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if not index_exists("sessions", "ix_sessions_metadata_gin", inspector):
+        op.create_index(
+            "ix_sessions_metadata_gin",
+            "sessions",
+            ["metadata"],
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+            schema=schema,
+        )
+
+
+def downgrade() -> None:
+    """Remove the GIN index on sessions.metadata."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if index_exists("sessions", "ix_sessions_metadata_gin", inspector):
+        op.drop_index(
+            "ix_sessions_metadata_gin",
+            table_name="sessions",
+            schema=schema,
+        )
@@ -42,6 +42,7 @@ export {
 export type {
   ConclusionQueryParams,
   ConclusionResponse,
+  CursorPageResponse,
   MessageResponse,
   PageResponse,
   PeerContextResponse,
@@ -5,6 +5,7 @@ import { Page } from './pagination'
 import { Peer } from './peer'
 import { SessionContext, SessionSummaries } from './session_context'
 import type {
+  CursorPageResponse,
   MessageResponse,
   PageResponse,
   PeerResponse,
@@ -255,9 +256,9 @@ export class Session {
     )
   }
 
-  private async _listPeers(): Promise<PageResponse<PeerResponse>> {
+  private async _listPeers(): Promise<CursorPageResponse<PeerResponse>> {
     await this._ensureWorkspace()
-    return this._http.get<PageResponse<PeerResponse>>(
+    return this._http.get<CursorPageResponse<PeerResponse>>(
       `/${API_VERSION}/workspaces/${this.workspaceId}/sessions/${this.id}/peers`
     )
   }
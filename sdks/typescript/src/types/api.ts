@@ -368,3 +368,8 @@ export interface PageResponse<T> {
   total: number
   pages: number
 }
+
+export interface CursorPageResponse<T> {
+  items: T[]
+  next_cursor?: string | null
+}
@@ -17,6 +17,9 @@ from .session import get_or_create_session
 
 logger = getLogger(__name__)
 
+# Rows fetched per round-trip when streaming messages under a token budget
+CONTEXT_STREAM_BATCH_SIZE = 100
+
 
 def _apply_token_limit(
     base_conditions: list[ColumnElement[Any]], token_limit: int
@@ -157,6 +160,10 @@ async def create_messages(
     Returns:
         List of created message objects
     """
+    # Tokenize anything not already encoded before touching the database, so no
+    # encoding happens while holding the session lock
+    schemas.encode_message_batch(messages)
+
     # Get or create session with peers in messages list
     peers = {message.peer_name: schemas.SessionPeerConfig() for message in messages}
     await get_or_create_session(
@@ -432,6 +439,7 @@ async def get_messages_id_range(
         session_name: Name of the session
         start_id: Primary key ID of the first message to return
         end_id: Primary key ID of the last message (exclusive)
+        token_limit: Maximum number of tokens across the most recent messages returned
 
     Returns:
         List of messages
@@ -451,12 +459,26 @@ async def get_messages_id_range(
         base_conditions.append(models.Message.id >= start_id)
 
     if token_limit:
-        # Apply token limit logic using helper function
-        stmt = _apply_token_limit(base_conditions, token_limit)
-        stmt = stmt.order_by(models.Message.id)
-    else:
-        stmt = select(models.Message).where(*base_conditions)
-
+        # Stream newest-first over a server-side cursor and stop as soon as the
+        # budget is spent, so long sessions are never fully scanned or loaded
+        stmt = (
+            select(models.Message)
+            .where(*base_conditions)
+            .order_by(models.Message.id.desc())
+            .execution_options(yield_per=CONTEXT_STREAM_BATCH_SIZE)
+        )
+        messages: list[models.Message] = []
+        remaining = token_limit
+        async with await db.stream_scalars(stmt) as stream:
+            async for message in stream:
+                if message.token_count > remaining:
+                    break
+                messages.append(message)
+                remaining -= message.token_count
+        messages.reverse()
+        return messages
+
+    stmt = select(models.Message).where(*base_conditions)
     result = await db.execute(stmt)
     return list(result.scalars().all())
 
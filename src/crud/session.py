@@ -4,7 +4,18 @@ from typing import Any
 
 from cashews import NOT_NONE
 from nanoid import generate as generate_nanoid
-from sqlalchemy import Select, and_, case, cast, delete, func, insert, select, update
+from sqlalchemy import (
+    Select,
+    and_,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -80,6 +91,48 @@ async def _fetch_session(
     )
 
 
+PEER_CONFIG_CACHE_KEY_TEMPLATE = (
+    "workspace:{workspace_name}:session:{session_name}:peer_config:{peer_name}"
+)
+PEER_CONFIG_CACHE_TTL_SECONDS = 60
+
+
+def peer_config_cache_key(
+    workspace_name: str, session_name: str, peer_name: str
+) -> str:
+    """Generate cache key for a session peer's configuration."""
+    return (
+        get_cache_namespace()
+        + ":"
+        + PEER_CONFIG_CACHE_KEY_TEMPLATE.format(
+            workspace_name=workspace_name,
+            session_name=session_name,
+            peer_name=peer_name,
+        )
+    )
+
+
+@cache(
+    key=PEER_CONFIG_CACHE_KEY_TEMPLATE,
+    ttl=f"{PEER_CONFIG_CACHE_TTL_SECONDS}s",
+    prefix=get_cache_namespace(),
+    condition=NOT_NONE,
+)
+async def _fetch_peer_config(
+    db: AsyncSession,
+    workspace_name: str,
+    session_name: str,
+    peer_name: str,
+) -> dict[str, Any] | None:
+    return await db.scalar(
+        select(models.SessionPeer.configuration).where(
+            models.SessionPeer.workspace_name == workspace_name,
+            models.SessionPeer.session_name == session_name,
+            models.SessionPeer.peer_name == peer_name,
+        )
+    )
+
+
 def count_observers_in_config(
     peer_configs: dict[str, schemas.SessionPeerConfig],
 ) -> int:
@@ -233,6 +286,13 @@ async def get_or_create_session(
     await db.commit()
     await db.refresh(honcho_session)
 
+    # Rejoining peers pick up their new configuration; invalidate only once it
+    # is committed so a concurrent read can't re-cache the old row
+    for peer_name in session.peer_names or {}:
+        await safe_cache_delete(
+            peer_config_cache_key(workspace_name, session.name, peer_name)
+        )
+
     # Only update cache if session data changed or was newly created
     if needs_cache_update:
         cache_key = session_cache_key(workspace_name, session.name)
@@ -555,19 +615,26 @@ async def delete_session(
         )
 
         # Delete SessionPeer associations
-        await db.execute(
-            delete(models.SessionPeer).where(
+        deleted_peer_names = await db.scalars(
+            delete(models.SessionPeer)
+            .where(
                 models.SessionPeer.session_name == session_name,
                 models.SessionPeer.workspace_name == workspace_name,
             )
+            .returning(models.SessionPeer.peer_name)
         )
+        peer_names = list(deleted_peer_names)
 
         # Finally, delete the session itself
         await db.delete(honcho_session)
         await db.commit()
 
-        # Invalidate session cache
+        # Invalidate session and peer configuration caches
         await safe_cache_delete(session_cache_key(workspace_name, session_name))
+        for peer_name in peer_names:
+            await safe_cache_delete(
+                peer_config_cache_key(workspace_name, session_name, peer_name)
+            )
 
         logger.debug("Session %s and all associated data deleted", session_name)
     except Exception as e:
@@ -625,6 +692,7 @@ async def clone_session(
     if cutoff_message_id is not None:
         stmt = select(models.Message).where(
             models.Message.public_id == cutoff_message_id,
+            models.Message.workspace_name == workspace_name,
             models.Message.session_name == original_session_name,
         )
         cutoff_message = await db.scalar(stmt)
@@ -645,7 +713,8 @@ async def clone_session(
 
     # Build query for messages to clone
     stmt = select(models.Message).where(
-        models.Message.session_name == original_session_name
+        models.Message.workspace_name == workspace_name,
+        models.Message.session_name == original_session_name,
     )
     if cutoff_message_id is not None and cutoff_message is not None:
         stmt = stmt.where(models.Message.id <= cast(cutoff_message.id, BigInteger))
@@ -655,39 +724,40 @@ async def clone_session(
     messages_to_clone_scalars = await db.scalars(stmt)
     messages_to_clone = messages_to_clone_scalars.all()
 
-    if not messages_to_clone:
-        return new_session
-
-    # Prepare bulk insert data
-    new_messages = [
-        {
-            "session_name": new_session.name,
-            "content": message.content,
-            "h_metadata": message.h_metadata,
-            "workspace_name": workspace_name,
-            "peer_name": message.peer_name,
-            "seq_in_session": message.seq_in_session,
-        }
-        for message in messages_to_clone
-    ]
+    if messages_to_clone:
+        # Prepare bulk insert data
+        new_messages = [
+            {
+                "session_name": new_session.name,
+                "content": message.content,
+                "h_metadata": message.h_metadata,
+                "workspace_name": workspace_name,
+                "peer_name": message.peer_name,
+                "seq_in_session": message.seq_in_session,
+                # Content is unchanged, so reuse the token count instead of re-encoding
+                "token_count": message.token_count,
+            }
+            for message in messages_to_clone
+        ]
 
-    insert_stmt = insert(models.Message).returning(models.Message)
-    result = await db.execute(insert_stmt, new_messages)
+        await db.execute(insert(models.Message), new_messages)
 
     # Clone peers from original session to new session (including their configurations)
-    stmt = select(models.SessionPeer).where(
-        models.SessionPeer.session_name == original_session_name
-    )
-    result = await db.execute(stmt)
-    session_peers = result.scalars().all()
-    for session_peer in session_peers:
-        new_session_peer = models.SessionPeer(
-            session_name=new_session.name,
-            peer_name=session_peer.peer_name,
-            workspace_name=workspace_name,
-            configuration=session_peer.configuration,
+    # server-side in a single INSERT ... SELECT
+    await db.execute(
+        insert(models.SessionPeer).from_select(
+            ["workspace_name", "session_name", "peer_name", "configuration"],
+            select(
+                models.SessionPeer.workspace_name,
+                literal(new_session.name),
+                models.SessionPeer.peer_name,
+                models.SessionPeer.configuration,
+            ).where(
+                models.SessionPeer.workspace_name == workspace_name,
+                models.SessionPeer.session_name == original_session_name,
+            ),
         )
-        db.add(new_session_peer)
+    )
 
     await db.commit()
     await db.refresh(new_session)
@@ -702,7 +772,7 @@ async def remove_peers_from_session(
     workspace_name: str,
     session_name: str,
     peer_names: set[str],
-) -> bool:
+) -> models.Session:
     """
     Remove specified peers from a session.
 
@@ -713,13 +783,13 @@ async def remove_peers_from_session(
         peer_names: Set of peer names to remove from the session
 
     Returns:
-        True if peers were removed successfully
+        The session the peers were removed from
 
     Raises:
         ResourceNotFoundException: If the session does not exist
     """
     # Verify session exists
-    await get_session(db, session_name, workspace_name)
+    session = await get_session(db, session_name, workspace_name)
 
     # Soft delete specified session peers by setting left_at timestamp
     update_stmt = (
@@ -735,32 +805,39 @@ async def remove_peers_from_session(
     await db.execute(update_stmt)
 
     await db.commit()
-    return True
+    return session
 
 
 async def get_peers_from_session(
     workspace_name: str,
     session_name: str,
+    *,
+    after_peer_name: str | None = None,
 ) -> Select[tuple[models.Peer]]:
     """
-    Get all peers from a session.
+    Get all peers from a session, ordered by peer name for keyset pagination.
 
     Args:
-        db: Database session
         workspace_name: Name of the workspace
         session_name: Name of the session
+        after_peer_name: If provided, only return peers whose name sorts after this one
 
     Returns:
-        Paginated list of Peer objects in the session
+        Select statement for the Peer objects in the session
     """
     # Get all active peers in the session (where left_at is NULL)
-    return (
+    stmt = (
         select(models.Peer)
         .join(models.SessionPeer, models.Peer.name == models.SessionPeer.peer_name)
         .where(models.SessionPeer.session_name == session_name)
+        .where(models.SessionPeer.workspace_name == workspace_name)
         .where(models.Peer.workspace_name == workspace_name)
         .where(models.SessionPeer.left_at.is_(None))  # Only active peers
     )
+    if after_peer_name is not None:
+        stmt = stmt.where(models.SessionPeer.peer_name > after_peer_name)
+
+    return stmt.order_by(models.SessionPeer.peer_name)
 
 
 async def get_session_peer_configuration(
@@ -800,7 +877,7 @@ async def set_peers_for_session(
     workspace_name: str,
     session_name: str,
     peer_names: dict[str, schemas.SessionPeerConfig],
-) -> list[models.SessionPeer]:
+) -> models.Session:
     """
     Set peers for a session, overwriting any existing peers.
     If peers don't exist, they will be created.
@@ -812,7 +889,7 @@ async def set_peers_for_session(
         peer_names: Set of peer names to set for the session
 
     Returns:
-        List of SessionPeer objects for all peers in the session
+        The session the peers were set on
 
     Raises:
         ResourceNotFoundException: If the session does not exist
@@ -823,48 +900,64 @@ async def set_peers_for_session(
         raise ObserverException(session_name, observer_count)
 
     # Verify session exists
-    stmt = (
-        select(models.Session)
-        .where(models.Session.workspace_name == workspace_name)
-        .where(models.Session.name == session_name)
-    )
-    result = await db.execute(stmt)
-    session = result.scalar_one_or_none()
+    session = await get_session(db, session_name, workspace_name)
 
-    if session is None:
-        raise ResourceNotFoundException(
-            f"Session {session_name} not found in workspace {workspace_name}"
-        )
+    # Get or create peers
+    await get_or_create_peers(
+        db,
+        workspace_name=workspace_name,
+        peers=[schemas.PeerCreate(name=peer_name) for peer_name in peer_names],
+    )
 
-    # Soft delete specified session peers by setting left_at timestamp
-    update_stmt = (
+    # Soft delete active session peers that aren't in the new set
+    leave_stmt = (
         update(models.SessionPeer)
         .where(
             models.SessionPeer.session_name == session_name,
             models.SessionPeer.workspace_name == workspace_name,
             models.SessionPeer.left_at.is_(None),  # Only update active peers
+            models.SessionPeer.peer_name.not_in(list(peer_names)),
         )
         .values(left_at=func.now())
     )
-    result = await db.execute(update_stmt)
 
-    # Get or create peers
-    await get_or_create_peers(
-        db,
-        workspace_name=workspace_name,
-        peers=[schemas.PeerCreate(name=peer_name) for peer_name in peer_names],
-    )
-
-    # Add new peers to session
-    peers = await _get_or_add_peers_to_session(
-        db,
-        workspace_name=workspace_name,
-        session_name=session_name,
-        peer_names=peer_names,
-    )
+    if peer_names:
+        # Upsert the new set in the same statement, with the soft delete as a
+        # data-modifying CTE. Every listed peer (re)joins with its new
+        # configuration, whether or not it was already active.
+        upsert_stmt = pg_insert(models.SessionPeer).values(
+            [
+                {
+                    "session_name": session_name,
+                    "peer_name": peer_name,
+                    "workspace_name": workspace_name,
+                    "joined_at": func.now(),
+                    "left_at": None,
+                    "configuration": configuration.model_dump(),
+                }
+                for peer_name, configuration in peer_names.items()
+            ]
+        )
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=["session_name", "peer_name", "workspace_name"],
+            set_={
+                "joined_at": func.now(),
+                "left_at": None,
+                "configuration": upsert_stmt.excluded.configuration,
+            },
+        ).add_cte(leave_stmt.returning(models.SessionPeer.peer_name).cte("left_peers"))
+        await db.execute(upsert_stmt)
+    else:
+        await db.execute(leave_stmt)
 
     await db.commit()
-    return peers
+
+    for peer_name in peer_names:
+        await safe_cache_delete(
+            peer_config_cache_key(workspace_name, session_name, peer_name)
+        )
+
+    return session
 
 
 async def _get_or_add_peers_to_session(
@@ -987,21 +1080,14 @@ async def get_peer_config(
     Raises:
         ResourceNotFoundException: If the session or peer does not exist
     """
-    # Get row from session_peer table
-    stmt = select(models.SessionPeer).where(
-        models.SessionPeer.workspace_name == workspace_name,
-        models.SessionPeer.session_name == session_name,
-        models.SessionPeer.peer_name == peer_id,
-    )
-    result = await db.execute(stmt)
-    session_peer = result.scalar_one_or_none()
+    configuration = await _fetch_peer_config(db, workspace_name, session_name, peer_id)
 
-    if session_peer is None:
+    if configuration is None:
         raise ResourceNotFoundException(
             f"Session peer {peer_id} not found in session {session_name} in workspace {workspace_name}"
         )
 
-    return schemas.SessionPeerConfig(**session_peer.configuration)
+    return schemas.SessionPeerConfig(**configuration)
 
 
 async def set_peer_config(
@@ -1091,3 +1177,6 @@ async def set_peer_config(
         db.add(session_peer)
 
     await db.commit()
+    await safe_cache_delete(
+        peer_config_cache_key(workspace_name, session_name, peer_name)
+    )
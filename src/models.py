@@ -193,6 +193,13 @@ class Session(Base):
         CheckConstraint("length(name) <= 512", name="name_length"),
         CheckConstraint("length(id) = 21", name="id_length"),
         CheckConstraint("id ~ '^[A-Za-z0-9_-]+$'", name="id_format"),
+        # GIN index for metadata filters, which compile to JSONB containment (@>)
+        Index(
+            "ix_sessions_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import suppress
 
@@ -19,6 +20,8 @@ from src.exceptions import (
 )
 from src.security import JWTParams, require_auth
 from src.utils import summarizer
+from src.utils.concurrency import gather_or_cancel
+from src.utils.pagination import build_cursor_page, decode_cursor
 from src.utils.representation import Representation
 from src.utils.search import search
 from src.utils.tokens import estimate_tokens
@@ -159,38 +162,6 @@ async def _get_both_summaries_task(
     return short, long
 
 
-async def _get_messages_for_context_task(
-    db: AsyncSession,
-    workspace_id: str,
-    session_id: str,
-    start_id: int,
-    token_limit: int,
-) -> list[schemas.Message]:
-    """
-    Fetch messages for context.
-
-    Args:
-        db: Database session to use for queries
-        workspace_id: The workspace identifier
-        session_id: The session identifier
-        start_id: Internal message PK to start from (messages after summary coverage)
-        token_limit: Maximum tokens for the messages
-
-    Returns:
-        List of messages as Pydantic schemas
-    """
-    if token_limit <= 0:
-        return []
-    messages = await crud.get_messages_id_range(
-        db,
-        workspace_id,
-        session_id,
-        start_id=start_id,
-        token_limit=token_limit,
-    )
-    return [schemas.Message.model_validate(msg) for msg in messages]
-
-
 def _select_summary_for_context(
     short_summary: schemas.Summary | None,
     long_summary: schemas.Summary | None,
@@ -214,23 +185,20 @@ def _select_summary_for_context(
 
     summary_budget = int(token_limit * 0.4)
 
-    long_len = long_summary.token_count if long_summary else 0
-    short_len = short_summary.token_count if short_summary else 0
-
-    if long_summary and long_len <= summary_budget and long_len > short_len:
-        return (
-            long_summary,
-            long_summary.message_id,
-            token_limit - long_len,
-        )
-    if short_summary and short_len <= summary_budget and short_len > 0:
-        return (
-            short_summary,
-            short_summary.message_id,
-            token_limit - short_len,
-        )
+    # Longest summary that fits, preferring the short one when both are the same length
+    summary = max(
+        (
+            candidate
+            for candidate in (short_summary, long_summary)
+            if candidate and 0 < candidate.token_count <= summary_budget
+        ),
+        key=lambda candidate: candidate.token_count,
+        default=None,
+    )
+    if summary is None:
+        return None, 0, token_limit
 
-    return None, 0, token_limit
+    return summary, summary.message_id, token_limit - summary.token_count
 
 
 @router.post(
@@ -246,12 +214,8 @@ async def get_sessions(
     db: AsyncSession = db,
 ):
     """Get all Sessions for a Workspace, paginated with optional filters."""
-    filter_param = None
-
-    if options and hasattr(options, "filters") and options.filters:
-        filter_param = options.filters
-        if filter_param == {}:  # Explicitly check for empty dict
-            filter_param = None
+    # An empty filters dict means no filtering
+    filter_param = (options.filters or None) if options else None
 
     return await apaginate(
         db, await crud.get_sessions(workspace_name=workspace_id, filters=filter_param)
@@ -304,7 +268,7 @@ async def get_or_create_session(
         response.status_code = 201 if result.created else 200
         return result.resource
     except ValueError as e:
-        logger.warning(f"Failed to get or create session {session.name}: {str(e)}")
+        logger.warning("Failed to get or create session %s: %s", session.name, e)
         raise ValidationException(str(e)) from e
 
 
@@ -330,7 +294,7 @@ async def update_session(
         )
         return updated_session
     except ValueError as e:
-        logger.warning(f"Failed to update session {session_id}: {str(e)}")
+        logger.warning("Failed to update session %s: %s", session_id, e)
         raise ResourceNotFoundException("Session not found") from e
 
 
@@ -375,7 +339,7 @@ async def delete_session(
         logger.debug("Session %s marked as inactive, deletion enqueued", session_id)
         return {"message": "Session deleted successfully"}
     except ValueError as e:
-        logger.warning(f"Failed to delete session {session_id}: {str(e)}")
+        logger.warning("Failed to delete session %s: %s", session_id, e)
         raise ResourceNotFoundException("Session not found") from e
 
 
@@ -407,7 +371,7 @@ async def clone_session(
         logger.debug("Session %s cloned successfully", session_id)
         return cloned_session
     except ValueError as e:
-        logger.warning(f"Failed to clone session {session_id}: {str(e)}")
+        logger.warning("Failed to clone session %s: %s", session_id, e)
         raise ResourceNotFoundException("Session not found") from e
 
 
@@ -420,7 +384,9 @@ async def clone_session(
 )
 async def add_peers_to_session(
     workspace_id: str = Path(...),
-    session_id: str = Path(...),
+    session_id: str = Path(
+        ..., min_length=1, max_length=100, pattern=schemas.RESOURCE_NAME_PATTERN
+    ),
     peers: dict[str, schemas.SessionPeerConfig] = Body(
         ...,
         description="List of peer IDs (with session-level configuration) to add to the session",
@@ -431,15 +397,16 @@ async def add_peers_to_session(
     try:
         result = await crud.get_or_create_session(
             db,
-            session=schemas.SessionCreate(
+            # session_id and peers were already validated during request parsing
+            session=schemas.SessionCreate.model_construct(
                 name=session_id,
-                peers=peers,
+                peer_names=peers,
             ),
             workspace_name=workspace_id,
         )
         return result.resource
     except ValueError as e:
-        logger.warning(f"Failed to add peers to session {session_id}: {str(e)}")
+        logger.warning("Failed to add peers to session %s: %s", session_id, e)
         raise ResourceNotFoundException("Session not found") from e
 
 
@@ -465,22 +432,16 @@ async def set_session_peers(
     This will fully replace the current set of Peers in the Session.
     """
     try:
-        await crud.set_peers_for_session(
+        session = await crud.set_peers_for_session(
             db,
             workspace_name=workspace_id,
             session_name=session_id,
             peer_names=peers,
         )
-        # Get the session to return
-        result = await crud.get_or_create_session(
-            db,
-            session=schemas.SessionCreate(name=session_id),
-            workspace_name=workspace_id,
-        )
         logger.debug("Set peers for session %s successfully", session_id)
-        return result.resource
+        return session
     except ValueError as e:
-        logger.warning(f"Failed to set peers for session {session_id}: {str(e)}")
+        logger.warning("Failed to set peers for session %s: %s", session_id, e)
         raise ResourceNotFoundException("Failed to set peers for session") from e
 
 
@@ -494,29 +455,23 @@ async def set_session_peers(
 async def remove_peers_from_session(
     workspace_id: str = Path(...),
     session_id: str = Path(...),
-    peers: list[str] = Body(
+    peers: schemas.PeerRemovalList = Body(
         ..., description="List of peer IDs to remove from the session"
     ),
     db: AsyncSession = db,
 ):
     """Remove Peers by ID from a Session."""
     try:
-        await crud.remove_peers_from_session(
+        session = await crud.remove_peers_from_session(
             db,
             workspace_name=workspace_id,
             session_name=session_id,
-            peer_names=set(peers),
-        )
-        # Get the session to return
-        result = await crud.get_or_create_session(
-            db,
-            session=schemas.SessionCreate(name=session_id),
-            workspace_name=workspace_id,
+            peer_names=peers.root,
         )
         logger.debug("Removed peers from session %s successfully", session_id)
-        return result.resource
+        return session
     except ValueError as e:
-        logger.warning(f"Failed to remove peers from session {session_id}: {str(e)}")
+        logger.warning("Failed to remove peers from session %s: %s", session_id, e)
         raise ResourceNotFoundException("Session not found") from e
 
 
@@ -571,14 +526,17 @@ async def set_peer_config(
         )
     except ValueError as e:
         logger.warning(
-            f"Failed to set peer config for {peer_id} in session {session_id}: {str(e)}"
+            "Failed to set peer config for %s in session %s: %s",
+            peer_id,
+            session_id,
+            e,
         )
         raise ResourceNotFoundException("Session not found") from e
 
 
 @router.get(
     "/{session_id}/peers",
-    response_model=Page[schemas.Peer],
+    response_model=schemas.CursorPage[schemas.Peer],
     dependencies=[
         Depends(require_auth(workspace_name="workspace_id", session_name="session_id"))
     ],
@@ -586,16 +544,30 @@ async def set_peer_config(
 async def get_session_peers(
     workspace_id: str = Path(...),
     session_id: str = Path(...),
+    cursor: str | None = Query(
+        None, description="Cursor returned by the previous page, if any"
+    ),
+    size: int = Query(50, ge=1, le=100, description="Page size"),
     db: AsyncSession = db,
 ):
-    """Get all Peers in a Session. Results are paginated."""
+    """Get all Peers in a Session. Results are paginated with a cursor."""
+    after_peer_name: str | None = None
+    if cursor is not None:
+        key = decode_cursor(cursor)
+        if len(key) != 1 or not isinstance(key[0], str):
+            raise ValidationException("Invalid pagination cursor")
+        after_peer_name = key[0]
+
     try:
         peers_query = await crud.get_peers_from_session(
-            workspace_name=workspace_id, session_name=session_id
+            workspace_name=workspace_id,
+            session_name=session_id,
+            after_peer_name=after_peer_name,
         )
-        return await apaginate(db, peers_query)
+        peers = (await db.scalars(peers_query.limit(size + 1))).all()
+        return build_cursor_page(peers, size, key=lambda peer: [peer.name])
     except ValueError as e:
-        logger.warning(f"Failed to get peers from session {session_id}: {str(e)}")
+        logger.warning("Failed to get peers from session %s: %s", session_id, e)
         raise ResourceNotFoundException("Session not found") from e
 
 
@@ -695,26 +667,44 @@ async def get_session_context(
         with suppress(Exception):
             embedding = await embedding_client.embed(search_query)
 
-    # Sequential calls on shared DB session
-    representation = await _get_working_representation_task(
-        db,
-        workspace_id,
-        search_query,
-        observer=observer,
-        observed=observed,
-        session_name=session_id if limit_to_session else None,
-        search_top_k=search_top_k,
-        search_max_distance=search_max_distance,
-        include_most_derived=include_most_frequent,
-        max_observations=max_conclusions,
-        embedding=embedding,
-    )
-    card = await _get_peer_card_task(
-        db, workspace_id, observer=observer, observed=observed
-    )
-    short_summary, long_summary = await _get_both_summaries_task(
-        db, workspace_id, session_id
+    async def load_peer_context() -> tuple[
+        Representation,
+        list[str] | None,
+        tuple[schemas.Summary | None, schemas.Summary | None],
+    ]:
+        # Sequential calls on shared DB session
+        representation = await _get_working_representation_task(
+            db,
+            workspace_id,
+            search_query,
+            observer=observer,
+            observed=observed,
+            session_name=session_id if limit_to_session else None,
+            search_top_k=search_top_k,
+            search_max_distance=search_max_distance,
+            include_most_derived=include_most_frequent,
+            max_observations=max_conclusions,
+            embedding=embedding,
+        )
+        card = await _get_peer_card_task(
+            db, workspace_id, observer=observer, observed=observed
+        )
+        summaries = await _get_both_summaries_task(db, workspace_id, session_id)
+        return representation, card, summaries
+
+    # The message budget isn't known until the representation, card and summary
+    # are, so speculatively fetch messages for the full budget on a separate
+    # connection in the meantime and trim them afterwards.
+    peer_context_task = asyncio.create_task(load_peer_context())
+    messages_task = asyncio.create_task(
+        summarizer.fetch_context_messages(
+            workspace_id, session_id, cutoff=None, token_limit=token_limit
+        )
     )
+    # Don't leave the speculative fetch running if loading the context fails
+    await gather_or_cancel(peer_context_task, messages_task)
+    representation, card, (short_summary, long_summary) = peer_context_task.result()
+    candidate_messages = messages_task.result()
 
     # Adjust token budget after accounting for representation + card tokens
     adjusted_limit = (
@@ -726,14 +716,20 @@ async def get_session_context(
         short_summary, long_summary, adjusted_limit, include_summary
     )
 
-    # Fetch messages with the correct start_id and budget
-    messages = await _get_messages_for_context_task(
-        db, workspace_id, session_id, messages_start_id, messages_budget
+    # Trim the speculatively fetched messages to the correct start_id and budget
+    messages = (
+        summarizer.trim_messages_to_token_budget(
+            candidate_messages,
+            start_id=messages_start_id,
+            token_limit=messages_budget,
+        )
+        if messages_budget > 0
+        else []
     )
 
     return schemas.SessionContext(
         name=session_id,
-        messages=messages,
+        messages=[schemas.Message.model_validate(msg) for msg in messages],
         summary=summary,
         peer_representation=representation.format_as_markdown(),
         peer_card=card,
@@ -1,7 +1,7 @@
 import datetime
 import ipaddress
 from enum import Enum
-from typing import Annotated, Any, Literal, Self, cast
+from typing import Annotated, Any, Generic, Literal, Self, TypeVar, cast
 from urllib.parse import urlparse
 
 import tiktoken
@@ -11,6 +11,7 @@ from pydantic import (
     ConfigDict,
     Field,
     PrivateAttr,
+    RootModel,
     field_validator,
     model_validator,
 )
@@ -20,6 +21,24 @@ from src.utils.types import DocumentLevel
 
 RESOURCE_NAME_PATTERN = r"^[a-zA-Z0-9_-]+$"
 
+# Shared by every *Create schema so the name constraints are declared once
+ResourceName = Annotated[
+    str,
+    Field(alias="id", min_length=1, max_length=100, pattern=RESOURCE_NAME_PATTERN),
+]
+
+T = TypeVar("T")
+
+_ENCODING: tiktoken.Encoding | None = None
+
+
+def _get_encoding() -> tiktoken.Encoding:
+    """Return the shared tiktoken encoding, loading it on first use."""
+    global _ENCODING
+    if _ENCODING is None:
+        _ENCODING = tiktoken.get_encoding("o200k_base")
+    return _ENCODING
+
 
 class DreamType(str, Enum):
     """Types of dreams that can be triggered."""
@@ -204,15 +223,18 @@ class SessionPeerConfig(PeerConfig):
     )
 
 
+class PeerRemovalList(
+    RootModel[Annotated[set[str], Field(min_length=1, max_length=100)]]
+):
+    """Peer IDs to remove from a session, deduplicated during request parsing."""
+
+
 class WorkspaceBase(BaseModel):
     pass
 
 
 class WorkspaceCreate(WorkspaceBase):
-    name: Annotated[
-        str,
-        Field(alias="id", min_length=1, max_length=100, pattern=RESOURCE_NAME_PATTERN),
-    ]
+    name: ResourceName
     metadata: dict[str, Any] = {}
     configuration: WorkspaceConfiguration = Field(
         default_factory=WorkspaceConfiguration
@@ -248,10 +270,7 @@ class PeerBase(BaseModel):
 
 
 class PeerCreate(PeerBase):
-    name: Annotated[
-        str,
-        Field(alias="id", min_length=1, max_length=100, pattern=RESOURCE_NAME_PATTERN),
-    ]
+    name: ResourceName
     metadata: dict[str, Any] | None = None
     configuration: dict[str, Any] | None = None
 
@@ -342,19 +361,31 @@ class MessageCreate(MessageBase):
     configuration: MessageConfiguration | None = None
     created_at: datetime.datetime | None = None
 
-    _encoded_message: list[int] = PrivateAttr(default=[])
+    _encoded_message: list[int] | None = PrivateAttr(default=None)
 
     @property
     def encoded_message(self) -> list[int]:
+        # Messages are normally encoded up front by encode_message_batch, so this
+        # only encodes messages that bypassed it, on first access
+        if self._encoded_message is None:
+            self._encoded_message = _get_encoding().encode(self.content)
         return self._encoded_message
 
-    @model_validator(mode="after")
-    def validate_and_set_token_count(self) -> Self:
-        encoding = tiktoken.get_encoding("o200k_base")
-        encoded_message = encoding.encode(self.content)
 
-        self._encoded_message = encoded_message
-        return self
+def encode_message_batch(messages: list[MessageCreate]) -> None:
+    """Tokenize every not-yet-encoded message in a single batched tiktoken call."""
+    pending = [
+        message
+        for message in messages
+        if message._encoded_message is None  # pyright: ignore[reportPrivateUsage]
+    ]
+    if not pending:
+        return
+    encoded_messages = _get_encoding().encode_batch(
+        [message.content for message in pending], num_threads=8
+    )
+    for message, encoded_message in zip(pending, encoded_messages, strict=True):
+        message._encoded_message = encoded_message  # pyright: ignore[reportPrivateUsage]
 
 
 class MessageGet(MessageBase):
@@ -387,6 +418,12 @@ class MessageBatchCreate(BaseModel):
 
     messages: list[MessageCreate] = Field(..., min_length=1, max_length=100)
 
+    @model_validator(mode="after")
+    def encode_messages(self) -> Self:
+        """Tokenize every message in a single batched tiktoken call."""
+        encode_message_batch(self.messages)
+        return self
+
 
 class MessageUploadCreate(BaseModel):
     """Schema for message creation from file uploads"""
@@ -404,10 +441,7 @@ class SessionBase(BaseModel):
 
 
 class SessionCreate(SessionBase):
-    name: Annotated[
-        str,
-        Field(alias="id", min_length=1, max_length=100, pattern=RESOURCE_NAME_PATTERN),
-    ]
+    name: ResourceName
     metadata: dict[str, Any] | None = None
     peer_names: dict[str, SessionPeerConfig] | None = Field(default=None, alias="peers")
     configuration: SessionConfiguration | None = None
@@ -662,8 +696,7 @@ class ConclusionCreate(BaseModel):
     @model_validator(mode="after")
     def validate_token_count(self) -> Self:
         """Validate that content doesn't exceed embedding token limit."""
-        encoding = tiktoken.get_encoding("o200k_base")
-        tokens = encoding.encode(self.content)
+        tokens = _get_encoding().encode(self.content)
         self._token_count = len(tokens)
 
         if self._token_count > settings.MAX_EMBEDDING_TOKENS:
@@ -824,6 +857,16 @@ class ScheduleDreamRequest(BaseModel):
     )
 
 
+class CursorPage(BaseModel, Generic[T]):
+    """A page of results fetched with keyset pagination."""
+
+    items: list[T]
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to pass to fetch the next page, or null if this is the last page",
+    )
+
+
 # Webhook endpoint schemas
 class WebhookEndpointBase(BaseModel):
     pass
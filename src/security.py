@@ -1,4 +1,5 @@
 import datetime
+import functools
 import logging
 from typing import Annotated
 
@@ -80,37 +81,56 @@ def create_jwt(params: JWTParams) -> str:
     )
 
 
+# Number of verified tokens kept per process. Clients reuse the same token
+# across requests, so a modest cache absorbs nearly all verifications.
+JWT_VERIFY_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=JWT_VERIFY_CACHE_SIZE)
+def _decode_jwt(token: str, secret: str) -> tuple[JWTParams, datetime.datetime | None]:
+    """
+    Verify a JWT signature and decode its parameters.
+
+    Results are memoized per token and secret, so a rotated secret never reuses
+    entries verified under the old one. Failed verifications raise and are never
+    cached. Expiry is returned rather than checked so that it is evaluated on
+    every request, including cache hits.
+    """
+    decoded = jwt.decode(token, secret.encode("utf-8"), algorithms=["HS256"])
+    params = JWTParams()
+    if "t" in decoded:
+        params.t = decoded["t"]
+    if "exp" in decoded:
+        params.exp = decoded["exp"]
+    if "ad" in decoded:
+        params.ad = decoded["ad"]
+    if "w" in decoded:
+        params.w = decoded["w"]
+    if "p" in decoded:
+        params.p = decoded["p"]
+    if "s" in decoded:
+        params.s = decoded["s"]
+    exp_time = parse_datetime_iso(params.exp) if params.exp else None
+    return params, exp_time
+
+
 def verify_jwt(token: str) -> JWTParams:
     """Verify a JWT and return the decoded parameters."""
 
-    params = JWTParams()
     try:
         if not settings.AUTH.JWT_SECRET:
             raise ValueError("AUTH_JWT_SECRET is not set, cannot verify JWT.")
-        decoded = jwt.decode(
-            token, settings.AUTH.JWT_SECRET.encode("utf-8"), algorithms=["HS256"]
-        )
-        if "t" in decoded:
-            params.t = decoded["t"]
-        if "exp" in decoded:
-            params.exp = decoded["exp"]
-            if params.exp:
-                exp_time = parse_datetime_iso(params.exp)
-                current_time = datetime.datetime.now(datetime.timezone.utc)
-                if exp_time < current_time:
-                    raise AuthenticationException("JWT expired")
-        if "ad" in decoded:
-            params.ad = decoded["ad"]
-        if "w" in decoded:
-            params.w = decoded["w"]
-        if "p" in decoded:
-            params.p = decoded["p"]
-        if "s" in decoded:
-            params.s = decoded["s"]
-        return params
+        params, exp_time = _decode_jwt(token, settings.AUTH.JWT_SECRET)
     except jwt.PyJWTError:
         raise AuthenticationException("Invalid JWT") from None
 
+    if exp_time is not None:
+        current_time = datetime.datetime.now(datetime.timezone.utc)
+        if exp_time < current_time:
+            raise AuthenticationException("JWT expired")
+    # Copy so callers can't mutate the cached instance
+    return params.model_copy()
+
 
 def require_auth(
     admin: bool | None = None,
@@ -0,0 +1,26 @@
+import asyncio
+from typing import Any
+
+
+async def gather_or_cancel(*tasks: asyncio.Task[Any]) -> None:
+    """
+    Wait for every task to finish, cancelling the rest as soon as one fails.
+
+    Plain asyncio.gather leaves sibling tasks running after the first failure,
+    which keeps speculative work (and any connection it holds) busy for a result
+    nobody reads. Every outcome is retrieved before the first error is re-raised,
+    so no task exception goes unobserved. Read results with `task.result()`.
+
+    Args:
+        tasks: Tasks to wait for
+
+    Raises:
+        BaseException: The first exception raised by any of the tasks
+    """
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
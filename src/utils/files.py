@@ -233,4 +233,10 @@ async def process_file_uploads_for_messages(
     if not all_message_data:
         raise FileProcessingError()
 
+    # Tokenize every chunk now, rather than lazily while creating the messages
+    # under the session lock
+    schemas.encode_message_batch(
+        [message_data["message_create"] for message_data in all_message_data]
+    )
+
     return all_message_data
@@ -0,0 +1,77 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Unlike offset pagination, keyset pagination never issues a COUNT(*) and does not
+have to skip over previous pages, so the cost of fetching a page is independent
+of how deep into the result set it is.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+from src.exceptions import ValidationException
+
+T = TypeVar("T")
+
+
+def encode_cursor(key: list[Any]) -> str:
+    """
+    Encode a row's sort key as an opaque, URL-safe cursor.
+
+    Args:
+        key: JSON-serializable values of the columns the page is ordered by
+
+    Returns:
+        The cursor string
+    """
+    raw = json.dumps(key, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    Decode a cursor produced by encode_cursor back into its sort key.
+
+    Args:
+        cursor: The cursor string supplied by the client
+
+    Returns:
+        The decoded sort key values
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValidationException("Invalid pagination cursor") from None
+    if not isinstance(key, list):
+        raise ValidationException("Invalid pagination cursor")
+    return key  # pyright: ignore[reportUnknownVariableType]
+
+
+def build_cursor_page(
+    rows: Sequence[T],
+    size: int,
+    key: Callable[[T], list[Any]],
+) -> dict[str, Any]:
+    """
+    Build a cursor page from a query that fetched up to `size + 1` rows.
+
+    The extra row is only used to detect whether another page exists and is
+    not returned.
+
+    Args:
+        rows: Rows in page order, over-fetched by one
+        size: Number of rows to return
+        key: Function returning the sort key of a row
+
+    Returns:
+        Dictionary matching schemas.CursorPage
+    """
+    items = list(rows[:size])
+    next_cursor = encode_cursor(key(items[-1])) if len(rows) > size and items else None
+    return {"items": items, "next_cursor": next_cursor}
@@ -5,6 +5,7 @@ RRF is a method to combine multiple ranked lists by computing the reciprocal
 of each item's rank in each list, then summing these reciprocal ranks.
 """
 
+import asyncio
 import re
 from typing import Any, TypeVar
 
@@ -13,9 +14,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import models
 from src.config import settings
+from src.dependencies import tracked_db
 from src.embedding_client import embedding_client
 from src.exceptions import ValidationException
 from src.models import session_peers_table
+from src.utils.concurrency import gather_or_cancel
 from src.utils.filter import apply_filter
 from src.utils.formatting import ILIKE_ESCAPE_CHAR, escape_ilike_pattern
 from src.vector_store import get_external_vector_store
@@ -65,9 +68,30 @@ def reciprocal_rank_fusion(*ranked_lists: list[T], k: int = 60, limit: int) -> l
     return result[:limit]
 
 
+async def _embed_query(query: str) -> list[float]:
+    """
+    Embed a search query for semantic search.
+
+    Args:
+        query: Search query
+
+    Returns:
+        The query embedding
+
+    Raises:
+        ValidationException: If query exceeds maximum token limit for embeddings
+    """
+    try:
+        return await embedding_client.embed(query)
+    except ValueError as e:
+        raise ValidationException(
+            f"Query exceeds maximum token limit of {settings.MAX_EMBEDDING_TOKENS}."
+        ) from e
+
+
 async def _semantic_search(
     db: AsyncSession,
-    query: str,
+    embedding_query: list[float],
     workspace_name: str,
     limit: int,
     filters: dict[str, Any] | None = None,
@@ -77,7 +101,7 @@ async def _semantic_search(
 
     Args:
         db: Database session
-        query: Search query
+        embedding_query: Embedding of the search query
         workspace_name: Name of the workspace to search in
         limit: Maximum number of results to return
         filters: Optional filters to apply at vector store level (supports: session_id, peer_id)
@@ -85,13 +109,6 @@ async def _semantic_search(
     Returns:
         list of messages ordered by semantic similarity
     """
-    try:
-        embedding_query = await embedding_client.embed(query)
-    except ValueError as e:
-        raise ValidationException(
-            f"Query exceeds maximum token limit of {settings.MAX_EMBEDDING_TOKENS}."
-        ) from e
-
     # Query Postgres / pgvector directly
     if settings.EMBED_MESSAGES and (
         settings.VECTOR_STORE.TYPE == "pgvector" or not settings.VECTOR_STORE.MIGRATED
@@ -307,6 +324,26 @@ async def _fulltext_search(
     return list(result.scalars().all())
 
 
+async def _tracked_fulltext_search(
+    query: str,
+    stmt: Select[tuple[models.Message]],
+    limit: int,
+) -> list[models.Message]:
+    """
+    Run the full-text search on its own short-lived session so no connection
+    is held while the query embedding is in flight.
+
+    Returns:
+        Detached messages ordered by text search relevance
+    """
+    async with tracked_db("search.fulltext") as fulltext_db:
+        results = await _fulltext_search(
+            db=fulltext_db, query=query, stmt=stmt, limit=limit
+        )
+        fulltext_db.expunge_all()
+    return results
+
+
 async def search(
     db: AsyncSession,
     query: str,
@@ -331,6 +368,9 @@ async def search(
     Returns:
         list of messages that match the search query, ordered by RRF relevance or individual search relevance
 
+    Note: When semantic search runs, the full-text query uses its own session
+    alongside the query embedding, so it only sees committed messages.
+
     Raises:
         ValidationException: If query exceeds maximum token limit for embeddings
     """
@@ -373,13 +413,29 @@ async def search(
     # Perform semantic search if enabled and we have workspace context
     # workspace_id is required for semantic search to determine the vector namespace
     workspace_name: str | None = filters.get("workspace_id") if filters else None
+    # Get more results for fusion
+    fulltext_limit = limit * 2
     if settings.EMBED_MESSAGES and isinstance(workspace_name, str):
-        # Type narrowing: workspace_name is guaranteed to be str in this block
+        # Embed the query (typically a remote API call) while the full-text
+        # query runs on its own short-lived session, so no connection sits idle
+        # waiting on the embedding. That session only sees committed messages.
+        fulltext_task = asyncio.create_task(
+            _tracked_fulltext_search(query=query, stmt=stmt, limit=fulltext_limit)
+        )
+        embed_task = asyncio.create_task(_embed_query(query))
+        await gather_or_cancel(fulltext_task, embed_task)
+
+        # Attach the full-text results to the request session so they share an
+        # identity map with the semantic results during fusion
+        fulltext_results = [
+            await db.merge(message, load=False) for message in fulltext_task.result()
+        ]
+
         # Get more results for fusion (increase if peer_perspective filtering is applied post-search)
         semantic_limit = limit * 4 if peer_perspective_name else limit * 2
         semantic_results = await _semantic_search(
             db=db,
-            query=query,
+            embedding_query=embed_task.result(),
             workspace_name=workspace_name,
             limit=semantic_limit,
             filters=filters,
@@ -393,13 +449,12 @@ async def search(
             )
 
         search_results.append(semantic_results)
+    else:
+        # Nothing to overlap with, so query on the request session directly
+        fulltext_results = await _fulltext_search(
+            db=db, query=query, stmt=stmt, limit=fulltext_limit
+        )
 
-    # Perform full-text search
-    # Get more results for fusion
-    fulltext_limit = limit * 2
-    fulltext_results = await _fulltext_search(
-        db=db, query=query, stmt=stmt, limit=fulltext_limit
-    )
     search_results.append(fulltext_results)
 
     # Combine results using RRF if we have multiple search methods
@@ -25,6 +25,7 @@ from src.telemetry.prometheus.metrics import (
     TokenTypes,
 )
 from src.utils.clients import HonchoLLMCallResponse, honcho_llm_call
+from src.utils.concurrency import gather_or_cancel
 from src.utils.formatting import utc_now_iso
 from src.utils.tokens import estimate_tokens, track_deriver_input_tokens
 
@@ -72,6 +73,8 @@ __all__ = [
     "get_summarized_history",
     "get_session_context",
     "get_session_context_formatted",
+    "fetch_context_messages",
+    "trim_messages_to_token_budget",
     "SummaryType",
     "Summary",
     "to_schema_summary",
@@ -789,68 +792,135 @@ async def get_session_context(
     summary = None
     messages_tokens = token_limit
     messages_start_id = 0
+    candidate_messages: list[models.Message] | None = None
 
     if include_summary:
         # Allocate 40% of tokens to summary, 60% to messages
         summary_tokens_limit = int(token_limit * 0.4)
 
-        latest_short_summary, latest_long_summary = await get_both_summaries(
-            db, workspace_name, session_name
+        # The message budget depends on which summary fits, so speculatively fetch
+        # messages for the whole budget on a separate connection while the
+        # summaries load, then trim them once the summary is chosen.
+        summaries_task = asyncio.create_task(
+            get_both_summaries(db, workspace_name, session_name)
         )
-
-        long_len = latest_long_summary["token_count"] if latest_long_summary else 0
-        short_len = latest_short_summary["token_count"] if latest_short_summary else 0
-
-        # Return the longest summary that fits within the token limit
-        if (
-            latest_long_summary
-            and long_len <= summary_tokens_limit
-            and long_len > short_len
-        ):
-            summary = schemas.Summary(
-                content=latest_long_summary["content"],
-                message_id=latest_long_summary["message_id"],
-                summary_type=latest_long_summary["summary_type"],
-                created_at=latest_long_summary["created_at"],
-                token_count=latest_long_summary["token_count"],
-                message_public_id=latest_long_summary.get("message_public_id", ""),
+        messages_task = asyncio.create_task(
+            fetch_context_messages(
+                workspace_name, session_name, cutoff=cutoff, token_limit=token_limit
             )
-            messages_tokens = token_limit - latest_long_summary["token_count"]
-            messages_start_id = latest_long_summary["message_id"]
-        elif (
-            latest_short_summary and short_len <= summary_tokens_limit and short_len > 0
-        ):
+        )
+        # Don't leave the speculative fetch running if the summaries fail
+        await gather_or_cancel(summaries_task, messages_task)
+        latest_short_summary, latest_long_summary = summaries_task.result()
+        candidate_messages = messages_task.result()
+
+        # Return the longest summary that fits within the token limit, preferring
+        # the short summary when both are the same length
+        best_summary = max(
+            (
+                candidate
+                for candidate in (latest_short_summary, latest_long_summary)
+                if candidate and 0 < candidate["token_count"] <= summary_tokens_limit
+            ),
+            key=lambda candidate: candidate["token_count"],
+            default=None,
+        )
+
+        if best_summary:
             summary = schemas.Summary(
-                content=latest_short_summary["content"],
-                message_id=latest_short_summary["message_id"],
-                summary_type=latest_short_summary["summary_type"],
-                created_at=latest_short_summary["created_at"],
-                token_count=latest_short_summary["token_count"],
-                message_public_id=latest_short_summary.get("message_public_id", ""),
+                content=best_summary["content"],
+                message_id=best_summary["message_id"],
+                summary_type=best_summary["summary_type"],
+                created_at=best_summary["created_at"],
+                token_count=best_summary["token_count"],
+                message_public_id=best_summary.get("message_public_id", ""),
             )
-            messages_tokens = token_limit - latest_short_summary["token_count"]
-            messages_start_id = latest_short_summary["message_id"]
+            messages_tokens = token_limit - summary.token_count
+            messages_start_id = summary.message_id
         else:
             logger.debug(
                 "No summary available for get_context call with token limit %s, returning empty string. Normal if brand-new session. long_summary_len: %s, short_summary_len: %s",
                 token_limit,
-                long_len,
-                short_len,
+                latest_long_summary["token_count"] if latest_long_summary else 0,
+                latest_short_summary["token_count"] if latest_short_summary else 0,
             )
 
     # Get recent messages after summary
-    messages = await crud.get_messages_id_range(
-        db,
-        workspace_name,
-        session_name,
-        start_id=messages_start_id,
-        end_id=cutoff,
-        token_limit=messages_tokens,
-    )
+    if candidate_messages is not None:
+        messages = trim_messages_to_token_budget(
+            candidate_messages,
+            start_id=messages_start_id,
+            token_limit=messages_tokens,
+        )
+    else:
+        messages = await crud.get_messages_id_range(
+            db,
+            workspace_name,
+            session_name,
+            start_id=messages_start_id,
+            end_id=cutoff,
+            token_limit=messages_tokens,
+        )
 
     return summary, messages
 
 
+async def fetch_context_messages(
+    workspace_name: str,
+    session_name: str,
+    *,
+    cutoff: int | None,
+    token_limit: int,
+) -> list[models.Message]:
+    """Fetch the most recent messages within token_limit on a dedicated DB session."""
+    if token_limit <= 0:
+        return []
+    async with tracked_db("get_session_context.messages") as db:
+        messages = await crud.get_messages_id_range(
+            db,
+            workspace_name,
+            session_name,
+            end_id=cutoff,
+            token_limit=token_limit,
+        )
+        # Detach so the messages stay readable after this session closes
+        db.expunge_all()
+        return messages
+
+
+def trim_messages_to_token_budget(
+    messages: list[models.Message],
+    *,
+    start_id: int,
+    token_limit: int,
+) -> list[models.Message]:
+    """
+    Trim messages fetched for a larger token budget down to a smaller one.
+
+    Keeps the most recent messages with an ID of at least start_id whose token counts
+    add up to no more than token_limit. Because the running token sum is taken from
+    the newest message backwards, this matches what get_messages_id_range returns
+    for the same start_id and token_limit.
+
+    Args:
+        messages: Messages ordered by ID ascending, fetched with a budget >= token_limit
+        start_id: Primary key ID of the oldest message that may be kept
+        token_limit: Maximum number of tokens across the kept messages
+
+    Returns:
+        The kept messages, ordered by ID ascending
+    """
+    kept: list[models.Message] = []
+    remaining = token_limit
+    for message in reversed(messages):
+        if message.id < start_id or message.token_count > remaining:
+            break
+        kept.append(message)
+        remaining -= message.token_count
+    kept.reverse()
+    return kept
+
+
 async def get_session_context_formatted(
     db: AsyncSession,
     workspace_name: str,
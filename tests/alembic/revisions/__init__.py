@@ -20,6 +20,7 @@ from . import (
     test_b8183c5ffb48_codify_document_level_and_times_derived,
     test_baa22cad81e2_standardize_constraint_names,
     test_bb6fb3a7a643_add_message_seq_in_session_column,
+    test_c7e2a9f4b1d3_add_sessions_metadata_gin_index,
     test_c3828084f472_add_indexes_for_messages_and_,
     test_d429de0e5338_adopt_peer_paradigm,
     test_e4eba9cfaa6f_make_document_session_name_nullable,
@@ -49,6 +50,7 @@ __all__ = [
     "test_baa22cad81e2_standardize_constraint_names",
     "test_bb6fb3a7a643_add_message_seq_in_session_column",
     "test_c3828084f472_add_indexes_for_messages_and_",
+    "test_c7e2a9f4b1d3_add_sessions_metadata_gin_index",
     "test_d429de0e5338_adopt_peer_paradigm",
     "test_e4eba9cfaa6f_make_document_session_name_nullable",
     "test_e9b705f9adf9_add_server_defaults_to_timestamp_",
@@ -0,0 +1,16 @@
+"""Hooks for revision c7e2a9f4b1d3 (sessions metadata GIN index)."""
+
+from __future__ import annotations
+
+from tests.alembic.registry import register_after_upgrade, register_before_upgrade
+from tests.alembic.verifier import MigrationVerifier
+
+
+@register_before_upgrade("c7e2a9f4b1d3")
+def prepare_sessions_metadata_gin(verifier: MigrationVerifier) -> None:
+    verifier.assert_indexes_not_exist([("sessions", "ix_sessions_metadata_gin")])
+
+
+@register_after_upgrade("c7e2a9f4b1d3")
+def verify_sessions_metadata_gin(verifier: MigrationVerifier) -> None:
+    verifier.assert_indexes_exist([("sessions", "ix_sessions_metadata_gin")])
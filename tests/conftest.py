@@ -751,6 +751,7 @@ def mock_tracked_db(db_engine: AsyncEngine, request: pytest.FixtureRequest):
         patch("src.dreamer.dream_scheduler.tracked_db", mock_tracked_db_context),
         patch("src.dialectic.chat.tracked_db", mock_tracked_db_context),
         patch("src.utils.summarizer.tracked_db", mock_tracked_db_context),
+        patch("src.utils.search.tracked_db", mock_tracked_db_context),
         patch("src.webhooks.events.tracked_db", mock_tracked_db_context),
     ):
         yield
@@ -0,0 +1,65 @@
+import pytest
+from nanoid import generate as generate_nanoid
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src import crud, models
+
+
+class TestMessageCRUD:
+    """Test suite for message CRUD operations"""
+
+    @pytest.mark.asyncio
+    async def test_get_messages_id_range_token_limit(
+        self,
+        db_session: AsyncSession,
+        sample_data: tuple[models.Workspace, models.Peer],
+    ):
+        """Test token-limited ranges keep the newest messages that fit the budget"""
+        test_workspace, test_peer = sample_data
+
+        test_session = models.Session(
+            name=str(generate_nanoid()), workspace_name=test_workspace.name
+        )
+        db_session.add(test_session)
+        await db_session.flush()
+
+        messages = [
+            models.Message(
+                content=f"Message {i}",
+                session_name=test_session.name,
+                peer_name=test_peer.name,
+                workspace_name=test_workspace.name,
+                seq_in_session=i + 1,
+                token_count=token_count,
+            )
+            for i, token_count in enumerate([5, 1, 4, 3, 2])
+        ]
+        db_session.add_all(messages)
+        await db_session.flush()
+
+        # Newest first: 2 + 3 fit in 6 tokens, the next message (4) does not
+        result = await crud.get_messages_id_range(
+            db_session, test_workspace.name, test_session.name, token_limit=6
+        )
+        assert [m.id for m in result] == [messages[3].id, messages[4].id]
+
+        # The budget stops at the first message that doesn't fit, even if an
+        # older one would
+        result = await crud.get_messages_id_range(
+            db_session,
+            test_workspace.name,
+            test_session.name,
+            end_id=messages[4].id,
+            token_limit=4,
+        )
+        assert [m.id for m in result] == [messages[3].id]
+
+        # start_id bounds the range even when the budget allows more
+        result = await crud.get_messages_id_range(
+            db_session,
+            test_workspace.name,
+            test_session.name,
+            start_id=messages[3].id,
+            token_limit=100,
+        )
+        assert [m.id for m in result] == [messages[3].id, messages[4].id]
@@ -102,6 +102,81 @@ class TestSessionCRUD:
                 db_session, test_workspace.name, test_session.name, "nonexistent_peer"
             )
 
+    @pytest.mark.asyncio
+    async def test_set_peer_config_invalidates_cached_config(
+        self,
+        db_session: AsyncSession,
+        sample_data: tuple[models.Workspace, models.Peer],
+    ):
+        """Test get_peer_config reflects set_peer_config after being cached"""
+        test_workspace, test_peer = sample_data
+
+        test_session = models.Session(
+            name=str(generate_nanoid()), workspace_name=test_workspace.name
+        )
+        db_session.add(test_session)
+        await db_session.flush()
+
+        await crud.set_peers_for_session(
+            db_session,
+            workspace_name=test_workspace.name,
+            session_name=test_session.name,
+            peer_names={test_peer.name: schemas.SessionPeerConfig(observe_me=True)},
+        )
+
+        # First read populates the cache
+        config = await crud.get_peer_config(
+            db_session, test_workspace.name, test_session.name, test_peer.name
+        )
+        assert config.observe_me is True
+
+        await crud.set_peer_config(
+            db_session,
+            test_workspace.name,
+            test_session.name,
+            test_peer.name,
+            schemas.SessionPeerConfig(observe_me=False),
+        )
+
+        config = await crud.get_peer_config(
+            db_session, test_workspace.name, test_session.name, test_peer.name
+        )
+        assert config.observe_me is False
+
+    @pytest.mark.asyncio
+    async def test_delete_session_invalidates_cached_peer_config(
+        self,
+        db_session: AsyncSession,
+        sample_data: tuple[models.Workspace, models.Peer],
+    ):
+        """Test get_peer_config raises after the session is deleted, even once cached"""
+        test_workspace, test_peer = sample_data
+
+        test_session = models.Session(
+            name=str(generate_nanoid()), workspace_name=test_workspace.name
+        )
+        db_session.add(test_session)
+        await db_session.flush()
+
+        await crud.set_peers_for_session(
+            db_session,
+            workspace_name=test_workspace.name,
+            session_name=test_session.name,
+            peer_names={test_peer.name: schemas.SessionPeerConfig(observe_me=True)},
+        )
+
+        # First read populates the cache
+        await crud.get_peer_config(
+            db_session, test_workspace.name, test_session.name, test_peer.name
+        )
+
+        await crud.delete_session(db_session, test_workspace.name, test_session.name)
+
+        with pytest.raises(ResourceNotFoundException):
+            await crud.get_peer_config(
+                db_session, test_workspace.name, test_session.name, test_peer.name
+            )
+
     @pytest.mark.asyncio
     async def test_clone_session_not_found(self, db_session: AsyncSession):
         """Test clone_session with non-existent session raises ResourceNotFoundException"""
@@ -132,3 +207,77 @@ class TestSessionCRUD:
             await crud.clone_session(
                 db_session, test_workspace.name, test_session.name, "invalid_message_id"
             )
+
+    @pytest.mark.asyncio
+    async def test_clone_session_without_messages_copies_peers(
+        self,
+        db_session: AsyncSession,
+        sample_data: tuple[models.Workspace, models.Peer],
+    ):
+        """Test clone_session copies session peers even when there are no messages"""
+        test_workspace, test_peer = sample_data
+
+        test_session = models.Session(
+            name=str(generate_nanoid()), workspace_name=test_workspace.name
+        )
+        db_session.add(test_session)
+        await db_session.flush()
+
+        await crud.set_peers_for_session(
+            db_session,
+            workspace_name=test_workspace.name,
+            session_name=test_session.name,
+            peer_names={test_peer.name: schemas.SessionPeerConfig(observe_me=False)},
+        )
+
+        new_session = await crud.clone_session(
+            db_session, test_workspace.name, test_session.name
+        )
+
+        config = await crud.get_peer_config(
+            db_session, test_workspace.name, new_session.name, test_peer.name
+        )
+        assert config.observe_me is False
+
+    @pytest.mark.asyncio
+    async def test_clone_session_rejects_cutoff_from_other_workspace(
+        self,
+        db_session: AsyncSession,
+        sample_data: tuple[models.Workspace, models.Peer],
+    ):
+        """Test clone_session ignores a cutoff message from a same-named session in another workspace"""
+        test_workspace, _test_peer = sample_data
+        session_name = str(generate_nanoid())
+
+        other_workspace = models.Workspace(name=str(generate_nanoid()))
+        db_session.add(other_workspace)
+        await db_session.flush()
+        other_peer = models.Peer(
+            name=str(generate_nanoid()), workspace_name=other_workspace.name
+        )
+        db_session.add_all(
+            [
+                models.Session(name=session_name, workspace_name=test_workspace.name),
+                models.Session(name=session_name, workspace_name=other_workspace.name),
+                other_peer,
+            ]
+        )
+        await db_session.flush()
+
+        other_message = models.Message(
+            content="Message in another workspace",
+            session_name=session_name,
+            peer_name=other_peer.name,
+            workspace_name=other_workspace.name,
+            seq_in_session=1,
+        )
+        db_session.add(other_message)
+        await db_session.flush()
+
+        with pytest.raises(
+            ValueError,
+            match="Message not found or doesn't belong to the specified session",
+        ):
+            await crud.clone_session(
+                db_session, test_workspace.name, session_name, other_message.public_id
+            )
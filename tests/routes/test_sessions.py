@@ -438,6 +438,9 @@ def test_clone_session(client: TestClient, sample_data: tuple[Workspace, Peer]):
     assert data["items"][1]["content"] == "Test message 2"
     assert data["items"][1]["metadata"] == {"key": "value2"}
 
+    # Token counts carry over so cloned sessions fill the same context budget
+    assert all(message["token_count"] > 0 for message in data["items"])
+
 
 def test_clone_session_with_cutoff(
     client: TestClient, sample_data: tuple[Workspace, Peer]
@@ -505,6 +508,20 @@ def test_add_peers_to_session(client: TestClient, sample_data: tuple[Workspace,
     assert response.status_code == 200
 
 
+def test_add_peers_to_session_invalid_session_id(
+    client: TestClient, sample_data: tuple[Workspace, Peer]
+):
+    test_workspace, test_peer = sample_data
+
+    # Session IDs must satisfy the same constraints as names in SessionCreate
+    for session_id in ["invalid.session", "a" * 101]:
+        response = client.post(
+            f"/v3/workspaces/{test_workspace.name}/sessions/{session_id}/peers",
+            json={test_peer.name: {}},
+        )
+        assert response.status_code == 422
+
+
 def test_get_session_peers(client: TestClient, sample_data: tuple[Workspace, Peer]):
     test_workspace, test_peer = sample_data
     # Create another peer
@@ -539,6 +556,53 @@ def test_get_session_peers(client: TestClient, sample_data: tuple[Workspace, Pee
     assert peer2_name in peer_names
 
 
+def test_get_session_peers_cursor_pagination(
+    client: TestClient, sample_data: tuple[Workspace, Peer]
+):
+    test_workspace, test_peer = sample_data
+    peer_names = [test_peer.name, str(generate_nanoid()), str(generate_nanoid())]
+
+    session_id = str(generate_nanoid())
+    response = client.post(
+        f"/v3/workspaces/{test_workspace.name}/sessions",
+        json={
+            "id": session_id,
+            "peer_names": {peer_name: {} for peer_name in peer_names},
+        },
+    )
+    assert response.status_code in [200, 201]
+
+    # First page
+    response = client.get(
+        f"/v3/workspaces/{test_workspace.name}/sessions/{session_id}/peers",
+        params={"size": 2},
+    )
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page["items"]) == 2
+    assert first_page["next_cursor"] is not None
+
+    # Second page picks up where the first left off
+    response = client.get(
+        f"/v3/workspaces/{test_workspace.name}/sessions/{session_id}/peers",
+        params={"size": 2, "cursor": first_page["next_cursor"]},
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert len(second_page["items"]) == 1
+    assert second_page["next_cursor"] is None
+
+    returned = [peer["id"] for peer in first_page["items"] + second_page["items"]]
+    assert sorted(returned) == sorted(peer_names)
+
+    # Malformed cursors are rejected
+    response = client.get(
+        f"/v3/workspaces/{test_workspace.name}/sessions/{session_id}/peers",
+        params={"cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 422
+
+
 def test_set_session_peers(client: TestClient, sample_data: tuple[Workspace, Peer]):
     test_workspace, test_peer = sample_data
     # Create another peer
@@ -6,11 +6,14 @@ from pydantic import ValidationError
 from src.schemas import (
     DocumentCreate,
     DocumentMetadata,
+    MessageBatchCreate,
     MessageCreate,
     PeerCreate,
+    PeerRemovalList,
     ResolvedConfiguration,
     SessionCreate,
     WorkspaceCreate,
+    encode_message_batch,
 )
 
 
@@ -79,6 +82,16 @@ class TestSessionValidations:
         error_dict = exc_info.value.errors()[0]
         assert error_dict["type"] == "string_too_short"
 
+    def test_peer_removal_list_deduplicates(self):
+        peers = PeerRemovalList.model_validate(["alice", "bob", "alice"])
+        assert peers.root == {"alice", "bob"}
+
+    def test_peer_removal_list_empty(self):
+        with pytest.raises(ValidationError) as exc_info:
+            PeerRemovalList.model_validate([])
+        error_dict = exc_info.value.errors()[0]
+        assert error_dict["type"] == "too_short"
+
 
 class TestMessageValidations:
     def test_valid_message_create(self):
@@ -93,6 +106,31 @@ class TestMessageValidations:
         error_dict = exc_info.value.errors()[0]
         assert error_dict["type"] == "string_too_long"
 
+    def test_batch_create_encodes_messages(self):
+        batch = MessageBatchCreate(
+            messages=[
+                MessageCreate(content="hello world", peer_id="12345"),
+                MessageCreate(content="", peer_id="12345"),
+            ]
+        )
+        standalone = MessageCreate(content="hello world", peer_id="12345")
+        assert batch.messages[0].encoded_message == standalone.encoded_message
+        assert batch.messages[1].encoded_message == []
+
+    def test_encode_message_batch_only_encodes_pending_messages(self):
+        encoded = MessageCreate(content="already encoded", peer_id="12345")
+        encoded._encoded_message = [1, 2, 3]  # pyright: ignore[reportPrivateUsage]
+        pending = MessageCreate(content="hello world", peer_id="12345")
+
+        encode_message_batch([encoded, pending])
+
+        assert encoded.encoded_message == [1, 2, 3]
+        assert pending._encoded_message is not None  # pyright: ignore[reportPrivateUsage]
+        assert (
+            pending.encoded_message
+            == MessageCreate(content="hello world", peer_id="12345").encoded_message
+        )
+
 
 class TestDocumentValidations:
     def test_valid_document_create(self):
@@ -1,12 +1,19 @@
 """Tests for search functionality including peer knowledge search."""
 
+import asyncio
 import datetime
+import gc
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 from nanoid import generate as generate_nanoid
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import models
+from src.exceptions import ValidationException
 from src.utils.search import search
 
 
@@ -62,7 +69,9 @@ async def test_peer_perspective_search_single_session(
         created_at=join_time + datetime.timedelta(seconds=2),
     )
     db_session.add_all([msg1, msg2])
-    await db_session.flush()
+    # With embeddings enabled, full-text search runs on its own session
+    # and only sees committed messages
+    await db_session.commit()
 
     # Search with peer_perspective filter
     results = await search(
@@ -132,7 +141,9 @@ async def test_peer_perspective_search_multiple_sessions(
         created_at=join_time + datetime.timedelta(seconds=2),
     )
     db_session.add_all([msg1, msg2])
-    await db_session.flush()
+    # With embeddings enabled, full-text search runs on its own session
+    # and only sees committed messages
+    await db_session.commit()
 
     # Search with peer_perspective filter
     results = await search(
@@ -212,7 +223,9 @@ async def test_peer_perspective_search_temporal_constraints(
         created_at=leave_time + datetime.timedelta(seconds=1),
     )
     db_session.add_all([msg_before, msg_during, msg_after])
-    await db_session.flush()
+    # With embeddings enabled, full-text search runs on its own session
+    # and only sees committed messages
+    await db_session.commit()
 
     # Search with peer_perspective filter
     results = await search(
@@ -279,7 +292,9 @@ async def test_peer_perspective_search_active_member(
         created_at=join_time + datetime.timedelta(seconds=100),
     )
     db_session.add_all([msg1, msg2])
-    await db_session.flush()
+    # With embeddings enabled, full-text search runs on its own session
+    # and only sees committed messages
+    await db_session.commit()
 
     # Search with peer_perspective filter
     results = await search(
@@ -339,7 +354,9 @@ async def test_peer_perspective_search_no_sessions(
         created_at=join_time + datetime.timedelta(seconds=1),
     )
     db_session.add(msg)
-    await db_session.flush()
+    # With embeddings enabled, full-text search runs on its own session
+    # and only sees committed messages
+    await db_session.commit()
 
     # Search with peer_perspective filter for peer1 (not in any sessions)
     results = await search(
@@ -408,7 +425,9 @@ async def test_peer_perspective_search_boundary_timestamps(
         created_at=leave_time,  # Exact leave time
     )
     db_session.add_all([msg_at_join, msg_at_leave])
-    await db_session.flush()
+    # With embeddings enabled, full-text search runs on its own session
+    # and only sees committed messages
+    await db_session.commit()
 
     # Search with peer_perspective filter
     results = await search(
@@ -422,3 +441,155 @@ async def test_peer_perspective_search_boundary_timestamps(
     assert len(results) == 2
     assert msg_at_join.public_id in [m.public_id for m in results]
     assert msg_at_leave.public_id in [m.public_id for m in results]
+
+
+def _recording_tracked_db(events: list[str], db_session: AsyncSession):
+    @asynccontextmanager
+    async def tracked_db(_: str | None = None) -> AsyncIterator[AsyncSession]:
+        events.append("fulltext_session_open")
+        try:
+            yield db_session
+        finally:
+            events.append("fulltext_session_closed")
+
+    return tracked_db
+
+
+@pytest.mark.asyncio
+async def test_search_overlaps_embedding_with_fulltext(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that the query is embedded while the full-text query runs on its own session."""
+    monkeypatch.setattr("src.config.settings.EMBED_MESSAGES", True)
+    events: list[str] = []
+    fulltext_started = asyncio.Event()
+
+    async def fake_fulltext(**_kwargs: Any) -> list[models.Message]:
+        events.append("fulltext")
+        fulltext_started.set()
+        return []
+
+    async def fake_embed(_query: str) -> list[float]:
+        # Only completes if the full-text query runs concurrently
+        await fulltext_started.wait()
+        events.append("embed")
+        return [0.0]
+
+    async def fake_semantic(**_kwargs: Any) -> list[models.Message]:
+        events.append("semantic")
+        return []
+
+    with (
+        patch("src.utils.search.tracked_db", _recording_tracked_db(events, db_session)),
+        patch("src.utils.search._fulltext_search", side_effect=fake_fulltext),
+        patch("src.utils.search._embed_query", side_effect=fake_embed),
+        patch("src.utils.search._semantic_search", side_effect=fake_semantic),
+    ):
+        results = await asyncio.wait_for(
+            search(db_session, "hello", filters={"workspace_id": "ws"}), timeout=5
+        )
+
+    assert results == []
+    # The full-text session is released before the request session is used again
+    assert events.index("fulltext_session_closed") < events.index("semantic")
+    assert events.index("embed") < events.index("semantic")
+
+
+@pytest.mark.asyncio
+async def test_search_cancels_embedding_when_fulltext_fails(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a failing full-text query cancels the in-flight embedding."""
+    monkeypatch.setattr("src.config.settings.EMBED_MESSAGES", True)
+    embed_cancelled = asyncio.Event()
+
+    async def failing_fulltext(**_kwargs: Any) -> list[models.Message]:
+        raise RuntimeError("fulltext failed")
+
+    async def slow_embed(_query: str) -> list[float]:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            embed_cancelled.set()
+            raise
+        return [0.0]
+
+    with (
+        patch("src.utils.search._fulltext_search", side_effect=failing_fulltext),
+        patch("src.utils.search._embed_query", side_effect=slow_embed),
+        pytest.raises(RuntimeError, match="fulltext failed"),
+    ):
+        await search(db_session, "hello", filters={"workspace_id": "ws"})
+
+    assert embed_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_search_retrieves_both_failures(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that when both calls fail, the other failure is still retrieved."""
+    monkeypatch.setattr("src.config.settings.EMBED_MESSAGES", True)
+    unretrieved: list[dict[str, Any]] = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _loop, context: unretrieved.append(context))
+
+    async def failing_embed(_query: str) -> list[float]:
+        raise ValidationException("too long")
+
+    async def failing_fulltext(**_kwargs: Any) -> list[models.Message]:
+        await asyncio.sleep(0)
+        raise RuntimeError("fulltext failed")
+
+    try:
+        with (
+            patch("src.utils.search._fulltext_search", side_effect=failing_fulltext),
+            patch("src.utils.search._embed_query", side_effect=failing_embed),
+            pytest.raises((ValidationException, RuntimeError)),
+        ):
+            await search(db_session, "hello", filters={"workspace_id": "ws"})
+
+        # Task exceptions are reported when the task is garbage collected
+        gc.collect()
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(None)
+
+    assert unretrieved == []
+
+
+@pytest.mark.asyncio
+async def test_search_without_embeddings_uses_request_session(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that full-text-only search runs on the caller's session and sees uncommitted rows."""
+    monkeypatch.setattr("src.config.settings.EMBED_MESSAGES", False)
+
+    workspace = models.Workspace(name=generate_nanoid())
+    db_session.add(workspace)
+    await db_session.flush()
+    peer = models.Peer(name="peer1", workspace_name=workspace.name)
+    session = models.Session(name="session1", workspace_name=workspace.name)
+    db_session.add_all([peer, session])
+    await db_session.flush()
+    message = models.Message(
+        content="Uncommitted message",
+        session_name=session.name,
+        peer_name=peer.name,
+        workspace_name=workspace.name,
+        seq_in_session=1,
+    )
+    db_session.add(message)
+    await db_session.flush()
+
+    with patch("src.utils.search.tracked_db") as mock_tracked_db:
+        results = await search(
+            db_session, "Uncommitted", filters={"workspace_id": workspace.name}
+        )
+
+    mock_tracked_db.assert_not_called()
+    assert [m.public_id for m in results] == [message.public_id]
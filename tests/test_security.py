@@ -0,0 +1,81 @@
+import datetime
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config import settings
+from src.exceptions import AuthenticationException
+from src.security import JWTParams, _decode_jwt, create_jwt, verify_jwt
+
+
+@pytest.fixture(autouse=True)
+def jwt_secret(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(settings.AUTH, "JWT_SECRET", "test-secret")
+    _decode_jwt.cache_clear()
+    yield
+    _decode_jwt.cache_clear()
+
+
+def _frozen_datetime(now: datetime.datetime) -> MagicMock:
+    """A stand-in for the datetime module whose clock reads `now`."""
+    fake = MagicMock(wraps=datetime)
+    fake.timezone = datetime.timezone
+    fake.datetime.now.return_value = now
+    return fake
+
+
+def test_verify_jwt_rejects_expired_token_on_cache_hit():
+    now = datetime.datetime.now(datetime.timezone.utc)
+    exp = now + datetime.timedelta(minutes=5)
+    claims = {"t": "", "w": "workspace", "exp": exp.isoformat()}
+
+    # PyJWT only accepts numeric exp claims, so stub out the decoded payload
+    with patch("src.security.jwt.decode", return_value=claims) as mock_decode:
+        assert verify_jwt("token").w == "workspace"
+
+        later = _frozen_datetime(exp + datetime.timedelta(seconds=1))
+        with (
+            patch("src.security.datetime", later),
+            pytest.raises(AuthenticationException, match="JWT expired"),
+        ):
+            verify_jwt("token")
+
+    # The second call was served from the cache, and expiry still applied
+    assert mock_decode.call_count == 1
+
+
+def test_verify_jwt_rotated_secret_misses_cache(monkeypatch: pytest.MonkeyPatch):
+    token = create_jwt(JWTParams(t="", w="workspace"))
+    assert verify_jwt(token).w == "workspace"
+
+    monkeypatch.setattr(settings.AUTH, "JWT_SECRET", "rotated-secret")
+
+    with pytest.raises(AuthenticationException, match="Invalid JWT"):
+        verify_jwt(token)
+
+
+def test_verify_jwt_does_not_cache_failures(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings.AUTH, "JWT_SECRET", "rotated-secret")
+    token = create_jwt(JWTParams(t="", w="workspace"))
+    monkeypatch.setattr(settings.AUTH, "JWT_SECRET", "test-secret")
+
+    with pytest.raises(AuthenticationException, match="Invalid JWT"):
+        verify_jwt(token)
+    assert _decode_jwt.cache_info().currsize == 0
+
+    # Once the secret matches again, the token verifies
+    monkeypatch.setattr(settings.AUTH, "JWT_SECRET", "rotated-secret")
+    assert verify_jwt(token).w == "workspace"
+
+
+def test_verify_jwt_returns_copy_of_cached_params():
+    token = create_jwt(JWTParams(t="", w="workspace"))
+
+    params = verify_jwt(token)
+    params.w = "other-workspace"
+    params.ad = True
+
+    cached = verify_jwt(token)
+    assert cached.w == "workspace"
+    assert cached.ad is None
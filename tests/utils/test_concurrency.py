@@ -0,0 +1,31 @@
+"""Tests for task helpers in src/utils/concurrency.py"""
+
+import asyncio
+
+import pytest
+
+from src.utils.concurrency import gather_or_cancel
+
+
+@pytest.mark.asyncio
+async def test_gather_or_cancel_returns_after_all_tasks_finish():
+    first = asyncio.create_task(asyncio.sleep(0, result=1))
+    second = asyncio.create_task(asyncio.sleep(0, result=2))
+
+    await gather_or_cancel(first, second)
+
+    assert (first.result(), second.result()) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_gather_or_cancel_cancels_siblings_on_failure():
+    async def fail() -> None:
+        raise RuntimeError("failed")
+
+    sibling = asyncio.create_task(asyncio.Event().wait())
+    failing = asyncio.create_task(fail())
+
+    with pytest.raises(RuntimeError, match="failed"):
+        await gather_or_cancel(failing, sibling)
+
+    assert sibling.cancelled()
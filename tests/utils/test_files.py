@@ -0,0 +1,28 @@
+"""Tests for file upload helpers in src/utils/files.py"""
+
+import io
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from src.utils.files import process_file_uploads_for_messages
+
+
+@pytest.mark.asyncio
+async def test_process_file_uploads_encodes_chunks_up_front():
+    # Chunks must be tokenized before crud.create_messages takes the session lock
+    upload = UploadFile(
+        io.BytesIO(b"hello world " * 10),
+        filename="notes.txt",
+        headers=Headers({"content-type": "text/plain"}),
+    )
+
+    message_data = await process_file_uploads_for_messages(
+        upload, peer_id="peer", max_chars=50
+    )
+
+    assert len(message_data) > 1
+    for item in message_data:
+        message_create = item["message_create"]
+        assert message_create._encoded_message is not None  # pyright: ignore[reportPrivateUsage]
@@ -0,0 +1,153 @@
+"""Tests for session context helpers in src/utils/summarizer.py and the sessions router"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src import models
+from src.exceptions import ResourceNotFoundException
+from src.routers.sessions import _select_summary_for_context
+from src.utils.summarizer import (
+    Summary,
+    fetch_context_messages,
+    get_session_context,
+    to_schema_summary,
+    trim_messages_to_token_budget,
+)
+
+
+def _messages(token_counts: list[int]) -> list[models.Message]:
+    return [
+        models.Message(id=i, token_count=token_count)
+        for i, token_count in enumerate(token_counts, start=1)
+    ]
+
+
+def test_trim_keeps_most_recent_messages_within_budget():
+    messages = _messages([5, 5, 5, 5])
+
+    trimmed = trim_messages_to_token_budget(messages, start_id=0, token_limit=12)
+
+    assert [m.id for m in trimmed] == [3, 4]
+
+
+def test_trim_respects_start_id():
+    messages = _messages([1, 1, 1, 1])
+
+    trimmed = trim_messages_to_token_budget(messages, start_id=3, token_limit=100)
+
+    assert [m.id for m in trimmed] == [3, 4]
+
+
+def test_trim_stops_at_first_message_over_budget():
+    # Matches the SQL running-sum semantics: an oversized message ends the window
+    # even if older messages would still fit.
+    messages = _messages([1, 50, 1])
+
+    trimmed = trim_messages_to_token_budget(messages, start_id=0, token_limit=10)
+
+    assert [m.id for m in trimmed] == [3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("token_limit", [0, -5])
+async def test_fetch_context_messages_skips_query_without_budget(token_limit: int):
+    # A non-positive limit would otherwise fall through to an unbounded select
+    with patch("src.utils.summarizer.tracked_db") as mock_tracked_db:
+        messages = await fetch_context_messages(
+            "workspace", "session", cutoff=None, token_limit=token_limit
+        )
+
+    assert messages == []
+    mock_tracked_db.assert_not_called()
+
+
+def _summary(summary_type: str, token_count: int, message_id: int) -> Summary:
+    return Summary(
+        content=summary_type,
+        message_id=message_id,
+        summary_type=summary_type,
+        created_at="2026-01-01T00:00:00Z",
+        token_count=token_count,
+        message_public_id=str(message_id),
+    )
+
+
+# (short tokens, long tokens, expected summary type). The summary budget is 40%
+# of a 100 token limit, so 40 tokens.
+SUMMARY_SELECTION_CASES = [
+    pytest.param(50, 30, "long", id="long_fits_when_short_does_not"),
+    pytest.param(30, 30, "short", id="tie_prefers_short"),
+]
+
+
+@pytest.mark.parametrize(
+    ("short_tokens", "long_tokens", "expected"), SUMMARY_SELECTION_CASES
+)
+def test_router_select_summary_for_context(
+    short_tokens: int, long_tokens: int, expected: str
+):
+    summary, start_id, budget = _select_summary_for_context(
+        to_schema_summary(_summary("short", short_tokens, message_id=9)),
+        to_schema_summary(_summary("long", long_tokens, message_id=5)),
+        token_limit=100,
+        include_summary=True,
+    )
+
+    assert summary is not None
+    assert summary.summary_type == expected
+    assert start_id == summary.message_id
+    assert budget == 100 - summary.token_count
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("short_tokens", "long_tokens", "expected"), SUMMARY_SELECTION_CASES
+)
+async def test_get_session_context_selects_summary(
+    short_tokens: int, long_tokens: int, expected: str
+):
+    short = _summary("short", short_tokens, message_id=9)
+    long = _summary("long", long_tokens, message_id=5)
+    with (
+        patch(
+            "src.utils.summarizer.get_both_summaries",
+            new=AsyncMock(return_value=(short, long)),
+        ),
+        patch(
+            "src.utils.summarizer.fetch_context_messages",
+            new=AsyncMock(return_value=[]),
+        ),
+    ):
+        summary, _messages = await get_session_context(
+            MagicMock(), "workspace", "session", token_limit=100
+        )
+
+    assert summary is not None
+    assert summary.summary_type == expected
+
+
+@pytest.mark.asyncio
+async def test_get_session_context_cancels_message_fetch_when_summaries_fail():
+    fetch_cancelled = asyncio.Event()
+
+    async def slow_fetch(*_args: object, **_kwargs: object) -> list[models.Message]:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            fetch_cancelled.set()
+            raise
+        return []
+
+    with (
+        patch(
+            "src.utils.summarizer.get_both_summaries",
+            new=AsyncMock(side_effect=ResourceNotFoundException("Session not found")),
+        ),
+        patch("src.utils.summarizer.fetch_context_messages", new=slow_fetch),
+        pytest.raises(ResourceNotFoundException),
+    ):
+        await get_session_context(MagicMock(), "workspace", "session", 100)
+
+    assert fetch_cancelled.is_set()